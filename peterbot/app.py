@@ -5,13 +5,13 @@ import logging
 import signal
 import sys
 from datetime import timedelta
-from typing import Any
 
 import discord
 from discord.ext import commands
 
 from .commands import register_handlers
-from .config import AppConfig
+from .config import AppConfig, warn_invalid_env_ints
+from .context import ChannelMessageCache
 from .knowledge import load_knowledge_index
 from .logging_utils import configure_logging, log_exception_with_context, log_with_context, set_logging_flags
 from .ollama_client import OllamaChatClient
@@ -26,6 +26,15 @@ def create_bot() -> commands.Bot:
     return commands.Bot(command_prefix="!", intents=intents)
 
 
+def build_channel_cache(config: AppConfig) -> ChannelMessageCache:
+    largest_limit = max(
+        config.channel_context_limit,
+        config.mention_context_fetch_limit,
+        config.recap_max_messages,
+    )
+    return ChannelMessageCache(largest_limit * 2)
+
+
 def build_runtime(bot: commands.Bot, config: AppConfig) -> PeterBotRuntime:
     knowledge_index = load_knowledge_index(
         knowledge_file=config.knowledge_file,
@@ -38,6 +47,7 @@ def build_runtime(bot: commands.Bot, config: AppConfig) -> PeterBotRuntime:
         reminder_manager=ReminderManager(data_dir=config.data_dir),
         knowledge_index=knowledge_index,
         retry_delay=timedelta(minutes=config.reminder_retry_minutes),
+        channel_cache=build_channel_cache(config),
     )
 
 
@@ -69,19 +79,40 @@ def validate_config(config: AppConfig) -> bool:
     return valid
 
 
-def register_signal_handlers(runtime: PeterBotRuntime) -> None:
-    def signal_handler(signum: int, frame: Any) -> None:
+def register_signal_handlers(bot: commands.Bot) -> None:
+    loop = asyncio.get_running_loop()
+
+    def request_shutdown(signum: int) -> None:
         log_with_context(
             logging.INFO,
             "Received shutdown signal; shutting down gracefully",
             signal=signum,
         )
-        runtime.reminder_manager.save_shutdown_time()
-        runtime.reminder_manager.save_reminders()
-        sys.exit(0)
+        loop.create_task(bot.close())
 
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, request_shutdown, signum)
+        except (NotImplementedError, RuntimeError):
+            log_with_context(
+                logging.DEBUG,
+                "Event loop signal handlers unavailable; relying on default signal handling",
+                signal=signum,
+            )
+
+
+async def start_bot(bot: commands.Bot, runtime: PeterBotRuntime, token: str) -> None:
+    register_signal_handlers(bot)
+    try:
+        async with bot:
+            await bot.start(token)
+    finally:
+        if runtime.reminder_task is not None:
+            runtime.reminder_task.cancel()
+        try:
+            await runtime.ollama_client.close()
+        except Exception:
+            log_exception_with_context("Failed to close HTTP session cleanly")
 
 
 def run_bot() -> None:
@@ -96,6 +127,7 @@ def run_bot() -> None:
         user_debug_ids_enabled=config.user_debug_ids_enabled,
         include_traceback_for_warning=config.include_traceback_for_warning,
     )
+    warn_invalid_env_ints()
 
     if not validate_config(config):
         raise SystemExit(1)
@@ -103,7 +135,6 @@ def run_bot() -> None:
     bot = create_bot()
     runtime = build_runtime(bot, config)
     register_handlers(bot, runtime)
-    register_signal_handlers(runtime)
 
     log_with_context(
         logging.INFO,
@@ -112,20 +143,21 @@ def run_bot() -> None:
         ollama_base_url=config.ollama_base_url,
         ollama_model=config.ollama_model,
         ollama_timeout_seconds=config.ollama_timeout_seconds,
+        ollama_connect_timeout_seconds=config.ollama_connect_timeout_seconds,
+        ollama_read_timeout_seconds=config.ollama_read_timeout_seconds,
+        ollama_max_retries=config.ollama_max_retries,
         ollama_think=config.ollama_think,
         model_profile=config.model_profile.value,
         user_debug_ids=config.user_debug_ids_enabled,
     )
 
     try:
-        bot.run(config.discord_token)
+        asyncio.run(start_bot(bot, runtime, config.discord_token))
+    except KeyboardInterrupt:
+        log_with_context(logging.INFO, "Received keyboard interrupt; shutting down")
     except Exception:
         log_exception_with_context("Bot terminated unexpectedly in main loop")
         raise
     finally:
         runtime.reminder_manager.save_shutdown_time()
         runtime.reminder_manager.save_reminders()
-        try:
-            asyncio.run(runtime.ollama_client.close())
-        except Exception:
-            log_exception_with_context("Failed to close HTTP session cleanly")
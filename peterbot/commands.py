@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any, Optional
 
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from .context import (
     build_current_mention_prompt_text,
@@ -35,9 +36,11 @@ from .prompts import (
     build_context_line,
     build_system_prompt,
 )
-from .reminders import check_missed_reminders, deliver_reminder, parse_reminder_time
+from .reminders import check_missed_reminders, deliver_reminders, parse_reminder_time, utc_now
 from .runtime import PeterBotRuntime
 
+REMINDER_MAX_SLEEP_SECONDS = 300
+
 
 def build_prompt_artifacts(
     *,
@@ -114,7 +117,7 @@ async def send_suggestion_to_channel(
         title="New Suggestion",
         description=suggestion,
         color=0x00FF00,
-        timestamp=datetime.now(),
+        timestamp=discord.utils.utcnow(),
     )
     embed.add_field(name="Suggested by", value=f"{username} (<@{user_id}>)", inline=False)
     embed.set_footer(text="PSS (Peter's Suggestion System)")
@@ -136,28 +139,32 @@ def clamp_recap_count(count: int, maximum: int) -> int:
     return max(5, min(count, maximum))
 
 
+def get_user_request_lock(runtime: PeterBotRuntime, user_id: int) -> asyncio.Lock:
+    lock = runtime.user_request_locks.get(user_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        runtime.user_request_locks[user_id] = lock
+    return lock
+
+
 def register_handlers(bot: commands.Bot, runtime: PeterBotRuntime) -> None:
     config = runtime.config
 
-    @tasks.loop(seconds=30)
-    async def reminder_checker() -> None:
-        due_reminders = runtime.reminder_manager.pop_due_reminders()
+    async def deliver_due_reminders() -> None:
+        now = utc_now()
+        due_reminders = runtime.reminder_manager.pop_due_reminders(now)
         if not due_reminders:
             return
 
-        retry_count = 0
-        for reminder in due_reminders:
-            status = await deliver_reminder(
-                bot,
-                runtime.reminder_manager,
-                reminder,
-                missed=False,
-            )
-            if status == "retry":
-                runtime.reminder_manager.requeue_reminder(reminder, runtime.retry_delay)
-                retry_count += 1
-
-        runtime.reminder_manager.save_reminders()
+        retry_count = await deliver_reminders(
+            bot,
+            runtime.reminder_manager,
+            due_reminders,
+            missed=False,
+            retry_delay=runtime.retry_delay,
+            now=now,
+        )
+        await runtime.reminder_manager.flush_reminders()
         if retry_count:
             log_with_context(
                 logging.INFO,
@@ -165,9 +172,18 @@ def register_handlers(bot: commands.Bot, runtime: PeterBotRuntime) -> None:
                 retry_count=retry_count,
             )
 
-    @reminder_checker.before_loop
-    async def before_reminder_checker() -> None:
+    async def run_reminder_scheduler() -> None:
         await bot.wait_until_ready()
+        while not bot.is_closed():
+            try:
+                await deliver_due_reminders()
+            except Exception:
+                log_exception_with_context("Reminder scheduler iteration failed")
+            await runtime.reminder_manager.wait_until_due(REMINDER_MAX_SLEEP_SECONDS)
+
+    @bot.event
+    async def setup_hook() -> None:
+        await runtime.ollama_client.ensure_http_session()
 
     @bot.event
     async def on_ready() -> None:
@@ -184,8 +200,9 @@ def register_handlers(bot: commands.Bot, runtime: PeterBotRuntime) -> None:
             channel_profiles=len(runtime.knowledge_index.channel_profiles),
         )
 
+        runtime.channel_cache.clear()
         if not runtime.has_initialized:
-            runtime.reminder_manager.load_reminders()
+            await runtime.reminder_manager.restore_reminders()
             await check_missed_reminders(
                 bot,
                 runtime.reminder_manager,
@@ -201,11 +218,12 @@ def register_handlers(bot: commands.Bot, runtime: PeterBotRuntime) -> None:
             except Exception:
                 log_exception_with_context("Failed syncing slash commands")
 
-        if not reminder_checker.is_running():
-            reminder_checker.start()
+        if runtime.reminder_task is None or runtime.reminder_task.done():
+            runtime.reminder_task = asyncio.create_task(run_reminder_scheduler())
 
     @bot.event
     async def on_message(message: discord.Message) -> None:
+        runtime.channel_cache.add(message)
         if message.author.bot:
             return
 
@@ -219,6 +237,7 @@ def register_handlers(bot: commands.Bot, runtime: PeterBotRuntime) -> None:
                     limit=config.mention_context_fetch_limit,
                     before=message.created_at,
                     max_chars=config.max_context_message_chars,
+                    cache=runtime.channel_cache,
                 )
                 explicit_reply_entry = await resolve_reply_target_entry(
                     message,
@@ -287,18 +306,19 @@ def register_handlers(bot: commands.Bot, runtime: PeterBotRuntime) -> None:
                     **message_log_context(message),
                 )
 
-                async with message.channel.typing():
-                    reply = await runtime.ollama_client.call_chat(
-                        prompt_text=content,
-                        author_name=message.author.display_name,
-                        guild_name=message.guild.name if message.guild else None,
-                        channel_name=getattr(message.channel, "name", None),
-                        conversation_history=mention_bundle["conversation_history"],
-                        system_prompt=system_prompt,
-                        user_content=mention_bundle["user_content"],
-                        user_images=mention_images,
-                        response_mode=MENTION_MODE,
-                    )
+                async with get_user_request_lock(runtime, message.author.id):
+                    async with message.channel.typing():
+                        reply = await runtime.ollama_client.call_chat(
+                            prompt_text=content,
+                            author_name=message.author.display_name,
+                            guild_name=message.guild.name if message.guild else None,
+                            channel_name=getattr(message.channel, "name", None),
+                            conversation_history=mention_bundle["conversation_history"],
+                            system_prompt=system_prompt,
+                            user_content=mention_bundle["user_content"],
+                            user_images=mention_images,
+                            response_mode=MENTION_MODE,
+                        )
                 await send_chunked_reply(
                     message,
                     reply or "(No response)",
@@ -321,10 +341,26 @@ def register_handlers(bot: commands.Bot, runtime: PeterBotRuntime) -> None:
 
         await bot.process_commands(message)
 
+    @bot.event
+    async def on_raw_message_delete(payload: discord.RawMessageDeleteEvent) -> None:
+        runtime.channel_cache.remove(payload.channel_id, [payload.message_id])
+
+    @bot.event
+    async def on_raw_bulk_message_delete(payload: discord.RawBulkMessageDeleteEvent) -> None:
+        runtime.channel_cache.remove(payload.channel_id, list(payload.message_ids))
+
+    @bot.event
+    async def on_raw_message_edit(payload: discord.RawMessageUpdateEvent) -> None:
+        runtime.channel_cache.replace(
+            payload.channel_id,
+            payload.message_id,
+            getattr(payload, "message", None),
+        )
+
     @bot.event
     async def on_disconnect() -> None:
         log_with_context(logging.INFO, "Bot disconnected from Discord gateway")
-        runtime.reminder_manager.save_reminders()
+        await runtime.reminder_manager.flush_reminders()
 
     @bot.event
     async def on_error(event_method: str, *args: Any, **kwargs: Any) -> None:
@@ -392,6 +428,7 @@ def register_handlers(bot: commands.Bot, runtime: PeterBotRuntime) -> None:
                 limit=config.channel_context_limit,
                 before=interaction.created_at,
                 max_chars=config.max_context_message_chars,
+                cache=runtime.channel_cache,
             )
             system_prompt, knowledge_chunks = build_prompt_artifacts(
                 config=config,
@@ -409,8 +446,19 @@ def register_handlers(bot: commands.Bot, runtime: PeterBotRuntime) -> None:
                 **interaction_log_context(interaction),
             )
 
-            if hasattr(interaction.channel, "typing"):
-                async with interaction.channel.typing():
+            async with get_user_request_lock(runtime, interaction.user.id):
+                if hasattr(interaction.channel, "typing"):
+                    async with interaction.channel.typing():
+                        reply = await runtime.ollama_client.call_chat(
+                            prompt_text=prompt,
+                            author_name=interaction.user.display_name,
+                            guild_name=interaction.guild.name if interaction.guild else None,
+                            channel_name=getattr(interaction.channel, "name", None),
+                            conversation_history=context_messages,
+                            system_prompt=system_prompt,
+                            response_mode=CHAT_MODE,
+                        )
+                else:
                     reply = await runtime.ollama_client.call_chat(
                         prompt_text=prompt,
                         author_name=interaction.user.display_name,
@@ -420,16 +468,6 @@ def register_handlers(bot: commands.Bot, runtime: PeterBotRuntime) -> None:
                         system_prompt=system_prompt,
                         response_mode=CHAT_MODE,
                     )
-            else:
-                reply = await runtime.ollama_client.call_chat(
-                    prompt_text=prompt,
-                    author_name=interaction.user.display_name,
-                    guild_name=interaction.guild.name if interaction.guild else None,
-                    channel_name=getattr(interaction.channel, "name", None),
-                    conversation_history=context_messages,
-                    system_prompt=system_prompt,
-                    response_mode=CHAT_MODE,
-                )
             delivered = await send_chunked_followup(
                 interaction,
                 reply or "(No response)",
@@ -470,6 +508,7 @@ def register_handlers(bot: commands.Bot, runtime: PeterBotRuntime) -> None:
                 limit=recap_count,
                 before=interaction.created_at,
                 max_chars=config.max_context_message_chars,
+                cache=runtime.channel_cache,
             )
             if not recent_entries:
                 await safe_send_interaction_message(
@@ -490,19 +529,20 @@ def register_handlers(bot: commands.Bot, runtime: PeterBotRuntime) -> None:
                 include_channel_profile=False,
                 include_knowledge=False,
             )
-            reply = await runtime.ollama_client.call_chat(
-                prompt_text=f"Summarize the last {len(recent_entries)} messages in this channel.",
-                author_name=interaction.user.display_name,
-                guild_name=interaction.guild.name if interaction.guild else None,
-                channel_name=getattr(interaction.channel, "name", None),
-                conversation_history=build_recap_history(recent_entries, interaction.created_at),
-                system_prompt=system_prompt,
-                user_content=(
-                    f"[Recap request | now] {interaction.user.display_name}: "
-                    f"Recap the last {len(recent_entries)} messages."
-                ),
-                response_mode=RECAP_MODE,
-            )
+            async with get_user_request_lock(runtime, interaction.user.id):
+                reply = await runtime.ollama_client.call_chat(
+                    prompt_text=f"Summarize the last {len(recent_entries)} messages in this channel.",
+                    author_name=interaction.user.display_name,
+                    guild_name=interaction.guild.name if interaction.guild else None,
+                    channel_name=getattr(interaction.channel, "name", None),
+                    conversation_history=build_recap_history(recent_entries, interaction.created_at),
+                    system_prompt=system_prompt,
+                    user_content=(
+                        f"[Recap request | now] {interaction.user.display_name}: "
+                        f"Recap the last {len(recent_entries)} messages."
+                    ),
+                    response_mode=RECAP_MODE,
+                )
             await send_chunked_followup(
                 interaction,
                 reply,
@@ -603,6 +643,7 @@ def register_handlers(bot: commands.Bot, runtime: PeterBotRuntime) -> None:
                 return
 
             runtime.reminder_manager.add_reminder(interaction.user.id, message, remind_time)
+            await runtime.reminder_manager.flush_reminders()
             time_str = remind_time.strftime("%A, %b %d, %Y at %I:%M %p")
             await safe_send_interaction_message(
                 interaction,
@@ -3,10 +3,10 @@ from __future__ import annotations
 import json
 import logging
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 from dotenv import load_dotenv
 
@@ -50,6 +50,18 @@ def resolve_model_profile(profile_name: str, model_name: str) -> ModelProfile:
     return ModelProfile.GENERIC
 
 
+INTEGER_ENV_NAMES = (
+    "SUGGESTION_CHANNEL_ID",
+    "OLLAMA_TIMEOUT_SECONDS",
+    "OLLAMA_CONNECT_TIMEOUT_SECONDS",
+    "OLLAMA_READ_TIMEOUT_SECONDS",
+    "OLLAMA_MAX_RETRIES",
+    "OLLAMA_NUM_PREDICT",
+    "OLLAMA_NUM_CTX",
+    "OLLAMA_CONCURRENCY",
+)
+
+
 def get_env_int(name: str) -> Optional[int]:
     raw = os.getenv(name)
     if raw is None or raw.strip() == "":
@@ -60,6 +72,13 @@ def get_env_int(name: str) -> Optional[int]:
         return None
 
 
+def warn_invalid_env_ints() -> None:
+    for name in INTEGER_ENV_NAMES:
+        raw = os.getenv(name)
+        if raw is not None and raw.strip() != "" and get_env_int(name) is None:
+            log_with_context(logging.WARNING, "Ignoring non-integer environment value", name=name, value=raw)
+
+
 def get_env_positive_int(name: str, default: int) -> int:
     value = get_env_int(name)
     if value is None or value <= 0:
@@ -67,6 +86,20 @@ def get_env_positive_int(name: str, default: int) -> int:
     return value
 
 
+def get_env_non_negative_int(name: str, default: int) -> int:
+    value = get_env_int(name)
+    if value is None or value < 0:
+        return default
+    return value
+
+
+def get_env_optional_positive_int(name: str) -> Optional[int]:
+    value = get_env_int(name)
+    if value is None or value <= 0:
+        return None
+    return value
+
+
 def resolve_data_directory(configured_dir: Optional[str] = None) -> str:
     default_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
     raw = configured_dir if configured_dir is not None else os.getenv("PETERBOT_DATA_DIR")
@@ -97,6 +130,15 @@ def parse_ollama_options(raw: Optional[str]) -> Dict[str, Any]:
     return parsed
 
 
+def parse_keep_alive(raw: Optional[str]) -> Optional[Union[str, int]]:
+    if raw is None or raw.strip() == "":
+        return None
+    value = raw.strip()
+    if value.lstrip("-").isdigit():
+        return int(value)
+    return value
+
+
 def normalize_optional_path(path: Optional[str]) -> Optional[str]:
     if path is None or path.strip() == "":
         return None
@@ -136,6 +178,13 @@ class AppConfig:
     recap_max_messages: int = 40
     reminder_retry_minutes: int = 5
     ollama_timeout_seconds: int = 300
+    ollama_connect_timeout_seconds: int = 10
+    ollama_read_timeout_seconds: Optional[int] = None
+    ollama_max_retries: int = 2
+    ollama_num_predict: int = 384
+    ollama_num_ctx: int = 8192
+    ollama_keep_alive: Optional[Union[str, int]] = "30m"
+    ollama_max_concurrency: int = 4
 
     @classmethod
     def from_env(cls) -> "AppConfig":
@@ -157,6 +206,13 @@ class AppConfig:
             knowledge_file=normalize_optional_path(os.getenv("PETER_KNOWLEDGE_FILE")),
             channel_profiles_file=normalize_optional_path(os.getenv("PETER_CHANNEL_PROFILES_FILE")),
             ollama_timeout_seconds=get_env_positive_int("OLLAMA_TIMEOUT_SECONDS", default=300),
+            ollama_connect_timeout_seconds=get_env_positive_int("OLLAMA_CONNECT_TIMEOUT_SECONDS", default=10),
+            ollama_read_timeout_seconds=get_env_optional_positive_int("OLLAMA_READ_TIMEOUT_SECONDS"),
+            ollama_max_retries=get_env_non_negative_int("OLLAMA_MAX_RETRIES", default=2),
+            ollama_num_predict=get_env_positive_int("OLLAMA_NUM_PREDICT", default=384),
+            ollama_num_ctx=get_env_positive_int("OLLAMA_NUM_CTX", default=8192),
+            ollama_keep_alive=parse_keep_alive(os.getenv("PETER_OLLAMA_KEEP_ALIVE", "30m")),
+            ollama_max_concurrency=get_env_positive_int("OLLAMA_CONCURRENCY", default=4),
             log_level=os.getenv("LOG_LEVEL", "INFO"),
             log_file=os.path.abspath(os.path.expanduser(os.getenv("LOG_FILE", "").strip()))
             if os.getenv("LOG_FILE", "").strip()
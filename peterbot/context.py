@@ -3,8 +3,10 @@ from __future__ import annotations
 import base64
 import logging
 import re
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
 
 import discord
 
@@ -19,30 +21,104 @@ from .logging_utils import (
 )
 
 
+class ChannelMessageCache:
+    def __init__(self, max_messages_per_channel: int) -> None:
+        self.max_messages_per_channel = max_messages_per_channel
+        self._channels: Dict[int, Deque[Any]] = {}
+
+    def add(self, message: Any) -> None:
+        channel_id = getattr(getattr(message, "channel", None), "id", None)
+        if channel_id is None:
+            return
+        messages = self._channels.get(channel_id)
+        if messages is None:
+            messages = deque(maxlen=self.max_messages_per_channel)
+            self._channels[channel_id] = messages
+        messages.append(message)
+
+    def remove(self, channel_id: int, message_ids: Sequence[int]) -> None:
+        messages = self._channels.get(channel_id)
+        if not messages:
+            return
+        removed_ids = set(message_ids)
+        self._channels[channel_id] = deque(
+            (msg for msg in messages if getattr(msg, "id", None) not in removed_ids),
+            maxlen=self.max_messages_per_channel,
+        )
+
+    def replace(self, channel_id: int, message_id: int, message: Optional[Any]) -> None:
+        messages = self._channels.get(channel_id)
+        if not messages:
+            return
+        for index, cached in enumerate(messages):
+            if getattr(cached, "id", None) == message_id:
+                if message is None:
+                    del messages[index]
+                else:
+                    messages[index] = message
+                return
+
+    def clear(self) -> None:
+        self._channels.clear()
+
+    def recent(self, channel_id: Optional[int], *, limit: int, before: Optional[datetime] = None) -> Optional[List[Any]]:
+        messages = self._channels.get(channel_id) if channel_id is not None else None
+        if not messages or limit <= 0:
+            return None
+
+        selected: List[Any] = []
+        for msg in reversed(messages):
+            if before is not None and msg.created_at >= before:
+                continue
+            selected.append(msg)
+            if len(selected) >= limit:
+                return selected
+        return None
+
+
+async def fetch_recent_messages(
+    channel: Any,
+    *,
+    limit: int,
+    before: Optional[datetime] = None,
+    cache: Optional[ChannelMessageCache] = None,
+) -> List[Any]:
+    if cache is not None:
+        cached = cache.recent(getattr(channel, "id", None), limit=limit, before=before)
+        if cached is not None:
+            return cached
+    return [msg async for msg in channel.history(limit=limit, before=before, oldest_first=False)]
+
+
 def split_for_discord(text: str, max_len: int = 1800) -> List[str]:
     if not text:
         return ["(No response)"]
 
-    remaining = text.strip()
+    end = len(text.rstrip())
+    pos = len(text) - len(text.lstrip())
+    min_split = max_len // 2
     chunks: List[str] = []
-    while remaining:
-        if len(remaining) <= max_len:
-            chunks.append(remaining)
+    while pos < end:
+        if end - pos <= max_len:
+            chunks.append(text[pos:end])
             break
 
-        split_at = remaining.rfind("\n", 0, max_len)
-        if split_at < max_len // 2:
-            split_at = remaining.rfind(" ", 0, max_len)
-        if split_at < max_len // 2:
+        limit = pos + max_len
+        split_at = text.rfind("\n", pos, limit) - pos
+        if split_at < min_split:
+            split_at = text.rfind(" ", pos, limit) - pos
+        if split_at < min_split:
             split_at = max_len
 
-        chunk = remaining[:split_at].strip()
+        chunk = text[pos:pos + split_at].rstrip()
         if not chunk:
-            chunk = remaining[:max_len]
+            chunk = text[pos:limit]
             split_at = max_len
 
         chunks.append(chunk)
-        remaining = remaining[split_at:].strip()
+        pos += split_at
+        while pos < end and text[pos].isspace():
+            pos += 1
     return chunks
 
 
@@ -130,25 +206,33 @@ async def safe_send_interaction_message(
 def build_message_content(msg: Any, *, max_chars: int = 500) -> Optional[str]:
     content = (getattr(msg, "content", "") or "").strip()
     attachments = getattr(msg, "attachments", None) or []
-    if attachments:
-        attachment_names = ", ".join(
-            getattr(attachment, "filename", "attachment") for attachment in attachments[:3]
-        )
+    if not attachments:
+        if not content:
+            return None
+    else:
+        if len(attachments) == 1:
+            attachment_names = getattr(attachments[0], "filename", "attachment")
+        else:
+            attachment_names = ", ".join(
+                getattr(attachment, "filename", "attachment") for attachment in attachments[:3]
+            )
         attachment_text = f"[attachments: {attachment_names}]"
-        content = f"{content}\n{attachment_text}".strip()
-
-    if not content:
-        return None
+        content = f"{content}\n{attachment_text}" if content else attachment_text
 
     if len(content) > max_chars:
         content = content[:max_chars] + "…"
     return content
 
 
+@lru_cache(maxsize=8)
+def bot_mention_pattern(bot_user_id: int) -> re.Pattern[str]:
+    return re.compile(rf"<@!?{bot_user_id}>")
+
+
 def strip_bot_mentions(text: str, bot_user_id: Optional[int]) -> str:
     stripped = text or ""
     if bot_user_id:
-        stripped = stripped.replace(f"<@{bot_user_id}>", "").replace(f"<@!{bot_user_id}>", "")
+        stripped = bot_mention_pattern(bot_user_id).sub("", stripped)
     return stripped.strip()
 
 
@@ -266,19 +350,15 @@ def format_context_message(
     peter_name: str,
     max_chars: int = 500,
 ) -> Optional[Dict[str, str]]:
-    entry = build_context_entry(
-        msg,
-        bot_user_id=bot_user_id,
-        peter_name=peter_name,
-        max_chars=max_chars,
-    )
-    if entry is None:
+    content = build_message_content(msg, max_chars=max_chars)
+    if not content:
         return None
 
-    content = entry["content"]
-    if entry["role"] == "user":
-        content = f"{entry['author_name']}: {content}"
-    return {"role": entry["role"], "content": content}
+    author = getattr(msg, "author", None)
+    if bot_user_id and getattr(author, "id", None) == bot_user_id:
+        return {"role": "assistant", "content": content}
+    author_name = getattr(author, "display_name", None) or getattr(author, "name", None) or peter_name
+    return {"role": "user", "content": f"{author_name}: {content}"}
 
 
 async def get_recent_channel_entries(
@@ -289,13 +369,15 @@ async def get_recent_channel_entries(
     limit: int,
     before: Optional[datetime] = None,
     max_chars: int = 500,
+    cache: Optional[ChannelMessageCache] = None,
 ) -> List[Dict[str, Any]]:
     if not hasattr(channel, "history"):
         return []
 
     recent_entries: List[Dict[str, Any]] = []
     try:
-        async for msg in channel.history(limit=limit, before=before, oldest_first=False):
+        recent_messages = await fetch_recent_messages(channel, limit=limit, before=before, cache=cache)
+        for msg in reversed(recent_messages):
             if msg.author.bot and (not bot_user_id or msg.author.id != bot_user_id):
                 continue
             formatted = build_context_entry(
@@ -316,7 +398,6 @@ async def get_recent_channel_entries(
         logger.warning("[%s] Using empty rich context due to fetch failure", debug_id)
         return []
 
-    recent_entries.reverse()
     return recent_entries
 
 
@@ -328,13 +409,15 @@ async def get_channel_context_messages(
     limit: int,
     before: Optional[datetime] = None,
     max_chars: int = 500,
+    cache: Optional[ChannelMessageCache] = None,
 ) -> List[Dict[str, str]]:
     if not hasattr(channel, "history"):
         return []
 
     context_messages: List[Dict[str, str]] = []
     try:
-        async for msg in channel.history(limit=limit, before=before, oldest_first=False):
+        recent_messages = await fetch_recent_messages(channel, limit=limit, before=before, cache=cache)
+        for msg in reversed(recent_messages):
             if msg.author.bot and (not bot_user_id or msg.author.id != bot_user_id):
                 continue
             formatted = format_context_message(
@@ -355,7 +438,6 @@ async def get_channel_context_messages(
         logger.warning("[%s] Using empty context due to fetch failure", debug_id)
         return []
 
-    context_messages.reverse()
     return context_messages
 
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import aiohttp
 
@@ -17,6 +18,12 @@ from .logging_utils import (
 )
 from .prompts import CHAT_MODE, build_chat_messages, cleanup_response_text, strip_think_blocks
 
+OLLAMA_CONNECTION_LIMIT = 64
+OLLAMA_CONNECTION_LIMIT_PER_HOST = 16
+OLLAMA_DNS_CACHE_SECONDS = 300
+OLLAMA_KEEPALIVE_SECONDS = 300
+OLLAMA_RETRY_BASE_DELAY_SECONDS = 0.5
+
 
 def build_ollama_payload(
     model: str,
@@ -24,35 +31,83 @@ def build_ollama_payload(
     *,
     think: bool = False,
     options: Optional[Dict[str, Any]] = None,
+    keep_alive: Optional[Union[str, int]] = None,
 ) -> Dict[str, Any]:
     payload: Dict[str, Any] = {
         "model": model,
-        "stream": False,
+        "stream": True,
         "think": think,
         "messages": messages,
     }
     if options:
         payload["options"] = options
+    if keep_alive is not None:
+        payload["keep_alive"] = keep_alive
     return payload
 
 
-def extract_ollama_response_content(data: Dict[str, Any]) -> Optional[str]:
-    msg = data.get("message", {}) if isinstance(data, dict) else {}
-    content = msg.get("content")
-    if not content:
-        content = data.get("response") if isinstance(data, dict) else None
-    return strip_think_blocks(content)
+def build_ollama_options(config: AppConfig) -> Dict[str, Any]:
+    return {
+        "num_predict": config.ollama_num_predict,
+        "num_ctx": config.ollama_num_ctx,
+        **config.ollama_options,
+    }
+
+
+def extract_ollama_chunk_content(chunk: Any) -> str:
+    if not isinstance(chunk, dict):
+        return ""
+    msg = chunk.get("message")
+    content = msg.get("content") if isinstance(msg, dict) else None
+    if content is None:
+        content = chunk.get("response")
+    return content or ""
+
+
+async def read_ollama_stream(resp: aiohttp.ClientResponse) -> Tuple[str, Optional[str]]:
+    parts: List[str] = []
+    async for raw_line in resp.content:
+        line = raw_line.strip()
+        if not line:
+            continue
+        chunk = json.loads(line)
+        if isinstance(chunk, dict) and chunk.get("error"):
+            return "".join(parts), str(chunk["error"])
+        parts.append(extract_ollama_chunk_content(chunk))
+        if isinstance(chunk, dict) and chunk.get("done"):
+            break
+    return "".join(parts), None
+
+
+def build_client_timeout(config: AppConfig) -> aiohttp.ClientTimeout:
+    return aiohttp.ClientTimeout(
+        total=config.ollama_timeout_seconds,
+        sock_connect=config.ollama_connect_timeout_seconds,
+        sock_read=config.ollama_read_timeout_seconds,
+    )
 
 
 class OllamaChatClient:
     def __init__(self, config: AppConfig) -> None:
         self.config = config
+        self.chat_url = f"{config.ollama_base_url.rstrip('/')}/api/chat"
         self.http_session: Optional[aiohttp.ClientSession] = None
+        self.request_slots: Optional[asyncio.Semaphore] = None
 
     async def ensure_http_session(self) -> None:
+        if self.request_slots is None:
+            self.request_slots = asyncio.Semaphore(self.config.ollama_max_concurrency)
         if self.http_session is None or self.http_session.closed:
-            timeout = aiohttp.ClientTimeout(total=self.config.ollama_timeout_seconds)
-            self.http_session = aiohttp.ClientSession(timeout=timeout)
+            connector = aiohttp.TCPConnector(
+                limit=OLLAMA_CONNECTION_LIMIT,
+                limit_per_host=OLLAMA_CONNECTION_LIMIT_PER_HOST,
+                ttl_dns_cache=OLLAMA_DNS_CACHE_SECONDS,
+                keepalive_timeout=OLLAMA_KEEPALIVE_SECONDS,
+            )
+            self.http_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=build_client_timeout(self.config),
+            )
 
     async def close(self) -> None:
         if self.http_session and not self.http_session.closed:
@@ -71,8 +126,7 @@ class OllamaChatClient:
         user_images: Optional[List[str]] = None,
         response_mode: str = CHAT_MODE,
     ) -> str:
-        await self.ensure_http_session()
-        url = f"{self.config.ollama_base_url.rstrip('/')}/api/chat"
+        url = self.chat_url
         request_debug_id = new_debug_id("REQ")
 
         messages = build_chat_messages(
@@ -88,7 +142,8 @@ class OllamaChatClient:
             self.config.ollama_model,
             messages,
             think=self.config.ollama_think,
-            options=self.config.ollama_options,
+            options=build_ollama_options(self.config),
+            keep_alive=self.config.ollama_keep_alive,
         )
 
         log_with_context(
@@ -105,10 +160,12 @@ class OllamaChatClient:
             user_image_count=len(user_images or []),
             mode=response_mode,
             timeout_seconds=self.config.ollama_timeout_seconds,
+            connect_timeout_seconds=self.config.ollama_connect_timeout_seconds,
+            read_timeout_seconds=self.config.ollama_read_timeout_seconds,
         )
 
         try:
-            if self.http_session is None:
+            if self.http_session is None or self.http_session.closed or self.request_slots is None:
                 debug_id = log_error_with_context(
                     "HTTP session unavailable before Ollama request",
                     request_id=request_debug_id,
@@ -121,47 +178,80 @@ class OllamaChatClient:
                 )
 
             allow_image_retry = bool(user_images)
+            retry_attempt = 0
             while True:
-                async with self.http_session.post(url, json=payload) as resp:
-                    if resp.status != 200:
-                        error_text = await resp.text()
-                        if allow_image_retry:
-                            allow_image_retry = False
-                            retry_messages = [dict(message) for message in payload["messages"]]
-                            retry_messages[-1].pop("images", None)
-                            payload = {**payload, "messages": retry_messages}
+                try:
+                    async with self.request_slots, self.http_session.post(url, json=payload) as resp:
+                        if resp.status != 200:
+                            error_text = await resp.text()
+                            if allow_image_retry:
+                                allow_image_retry = False
+                                retry_messages = [dict(message) for message in payload["messages"]]
+                                retry_messages[-1].pop("images", None)
+                                payload = {**payload, "messages": retry_messages}
+                                log_with_context(
+                                    logging.WARNING,
+                                    "Retrying Ollama chat without images after multimodal failure",
+                                    request_id=request_debug_id,
+                                    status=resp.status,
+                                    model=self.config.ollama_model,
+                                    response_preview=truncate_for_log(error_text, max_chars=500),
+                                )
+                                continue
+
+                            debug_id = new_debug_id("OLL")
                             log_with_context(
-                                logging.WARNING,
-                                "Retrying Ollama chat without images after multimodal failure",
+                                logging.ERROR,
+                                f"[{debug_id}] Ollama chat failed with non-200 status",
                                 request_id=request_debug_id,
                                 status=resp.status,
-                                model=self.config.ollama_model,
                                 response_preview=truncate_for_log(error_text, max_chars=500),
+                                url=url,
+                                model=self.config.ollama_model,
+                            )
+                            return build_user_debug_message(
+                                "Sorry, I couldn't reach the model service right now.",
+                                debug_id,
                             )
-                            continue
-
-                        debug_id = new_debug_id("OLL")
-                        log_with_context(
-                            logging.ERROR,
-                            f"[{debug_id}] Ollama chat failed with non-200 status",
-                            request_id=request_debug_id,
-                            status=resp.status,
-                            response_preview=truncate_for_log(error_text, max_chars=500),
-                            url=url,
-                            model=self.config.ollama_model,
-                        )
-                        return build_user_debug_message(
-                            "Sorry, I couldn't reach the model service right now.",
-                            debug_id,
-                        )
 
-                    data = await resp.json(content_type=None)
-                    content = extract_ollama_response_content(data) or "(No response from model)"
-                    return cleanup_response_text(
-                        content,
-                        profile=self.config.model_profile,
-                        mode=response_mode,
+                        streamed_text, stream_error = await read_ollama_stream(resp)
+                        if stream_error:
+                            debug_id = new_debug_id("OLL")
+                            log_with_context(
+                                logging.ERROR,
+                                f"[{debug_id}] Ollama chat stream reported an error",
+                                request_id=request_debug_id,
+                                error=truncate_for_log(stream_error, max_chars=500),
+                                partial_chars=len(streamed_text),
+                                url=url,
+                                model=self.config.ollama_model,
+                            )
+                            return build_user_debug_message(
+                                "Sorry, the model failed while generating a response.",
+                                debug_id,
+                            )
+
+                        content = strip_think_blocks(streamed_text) or "(No response from model)"
+                        return cleanup_response_text(
+                            content,
+                            profile=self.config.model_profile,
+                            mode=response_mode,
+                        )
+                except (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError) as exc:
+                    if retry_attempt >= self.config.ollama_max_retries:
+                        raise
+                    retry_attempt += 1
+                    retry_delay = OLLAMA_RETRY_BASE_DELAY_SECONDS * (2 ** (retry_attempt - 1))
+                    log_with_context(
+                        logging.WARNING,
+                        "Retrying Ollama chat after transient connection failure",
+                        request_id=request_debug_id,
+                        attempt=retry_attempt,
+                        max_retries=self.config.ollama_max_retries,
+                        delay_seconds=retry_delay,
+                        error=repr(exc),
                     )
+                    await asyncio.sleep(retry_delay)
         except asyncio.TimeoutError:
             debug_id = log_exception_with_context(
                 "Ollama request timed out",
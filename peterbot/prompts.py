@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
 
 from .config import AppConfig, ModelProfile
 from .knowledge import ChannelProfile, KnowledgeChunk, build_knowledge_excerpt
@@ -10,6 +11,48 @@ CHAT_MODE = "chat"
 MENTION_MODE = "mention"
 RECAP_MODE = "recap"
 
+THINK_BLOCK_RE = re.compile(r"<\s*think\b[^>]*>[\s\S]*?<\s*/\s*think\s*>", re.IGNORECASE)
+LITERAL_SPAN_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"`[^`]+`",
+        r"https?://\S+",
+        r"(?:\b[\w.-]+/)+[\w.-]+\b",
+        r"\b[\w.-]+\.[A-Za-z0-9]{1,8}\b",
+    )
+)
+LOW_VALUE_BANTER_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"\byou got me with that one\b",
+        r"\banything specific you wanted to know\b",
+        r"\banything else\b",
+        r"\blet me know if you want more\b",
+        r"\bhope that helps\b",
+        r"\bif you want more detail\b",
+        r"\bwhat'?s up\b",
+        r"\bgot me with that one\b",
+    )
+)
+CANNED_OPENER_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"^(?:sure|absolutely|of course|certainly|totally|yep)[,!\s-]+",
+        r"^here(?:'s| is) (?:a )?(?:quick )?(?:answer|summary|recap)[:,.\s-]+",
+        r"^(?:hey|hi|hello)\s+[A-Za-z0-9_]+(?:\s*[,:]|(?:\s+-\s+)|\s+)",
+    )
+)
+CANNED_SIGNOFF_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\n*\s*(?:let me know if you want more detail\.?)\s*$",
+        r"\n*\s*(?:hope that helps[.!]?)\s*$",
+        r"\n*\s*(?:feel free to ask if you want more\.?)\s*$",
+        r"\n*\s*(?:anything specific you wanted to know\??)\s*$",
+        r"\n*\s*(?:anything else\??)\s*$",
+    )
+)
+
 
 def build_context_line(
     *,
@@ -78,6 +121,16 @@ def mode_specific_rules(mode: str) -> List[str]:
     ]
 
 
+@lru_cache(maxsize=None)
+def style_rules_block(profile: ModelProfile) -> str:
+    return "Style rules:\n" + "\n".join(f"- {rule}" for rule in profile_style_rules(profile))
+
+
+@lru_cache(maxsize=None)
+def task_rules_block(mode: str) -> str:
+    return "Task rules:\n" + "\n".join(f"- {rule}" for rule in mode_specific_rules(mode))
+
+
 def channel_profile_block(channel_profile: Optional[ChannelProfile]) -> Optional[str]:
     if channel_profile is None:
         return None
@@ -115,8 +168,8 @@ def build_system_prompt(
     blocks = [
         config.peter_system_prompt.strip(),
         f"Identity: Your name is {config.peter_name}.{context_line}",
-        "Style rules:\n" + "\n".join(f"- {rule}" for rule in profile_style_rules(config.model_profile)),
-        "Task rules:\n" + "\n".join(f"- {rule}" for rule in mode_specific_rules(mode)),
+        style_rules_block(config.model_profile),
+        task_rules_block(mode),
     ]
     if focus_note:
         blocks.append(f"Focused context: {focus_note}")
@@ -130,10 +183,10 @@ def build_system_prompt(
 
 
 def add_no_think_suffix(text: str, *, allow_thinking: bool = False) -> str:
-    if allow_thinking or "/no_think" in text:
+    if allow_thinking:
         return text
     stripped = text.rstrip()
-    if not stripped:
+    if not stripped or stripped.endswith("/no_think"):
         return text
     return f"{stripped} /no_think"
 
@@ -168,12 +221,7 @@ def build_chat_messages(
 def strip_think_blocks(text: str) -> str:
     if not text:
         return text
-    cleaned = re.sub(
-        r"<\s*think\b[^>]*>[\s\S]*?<\s*/\s*think\s*>",
-        "",
-        text,
-        flags=re.IGNORECASE,
-    )
+    cleaned = THINK_BLOCK_RE.sub("", text) if "<" in text else text
     return cleaned.replace("/no_think", "").strip()
 
 
@@ -185,12 +233,6 @@ def collapse_repeated_punctuation(text: str) -> str:
 
 
 def protect_literal_spans(text: str) -> tuple[str, Dict[str, str]]:
-    patterns = (
-        r"`[^`]+`",
-        r"https?://\S+",
-        r"(?:\b[\w.-]+/)+[\w.-]+\b",
-        r"\b[\w.-]+\.[A-Za-z0-9]{1,8}\b",
-    )
     replacements: Dict[str, str] = {}
 
     def replacer(match: re.Match[str]) -> str:
@@ -199,8 +241,8 @@ def protect_literal_spans(text: str) -> tuple[str, Dict[str, str]]:
         return key
 
     protected = text
-    for pattern in patterns:
-        protected = re.sub(pattern, replacer, protected)
+    for pattern in LITERAL_SPAN_PATTERNS:
+        protected = pattern.sub(replacer, protected)
     return protected, replacements
 
 
@@ -233,17 +275,7 @@ def is_low_value_banter(text: str) -> bool:
     if not normalized:
         return True
 
-    patterns = (
-        r"\byou got me with that one\b",
-        r"\banything specific you wanted to know\b",
-        r"\banything else\b",
-        r"\blet me know if you want more\b",
-        r"\bhope that helps\b",
-        r"\bif you want more detail\b",
-        r"\bwhat'?s up\b",
-        r"\bgot me with that one\b",
-    )
-    if any(re.search(pattern, normalized) for pattern in patterns):
+    if any(pattern.search(normalized) for pattern in LOW_VALUE_BANTER_PATTERNS):
         return True
 
     short_agreement = re.fullmatch(
@@ -305,18 +337,13 @@ def normalize_simple_greeting_response(text: str) -> str:
 
 
 def remove_canned_openers(text: str) -> str:
-    opener_patterns = (
-        r"^(?:sure|absolutely|of course|certainly|totally|yep)[,!\s-]+",
-        r"^here(?:'s| is) (?:a )?(?:quick )?(?:answer|summary|recap)[:,.\s-]+",
-        r"^(?:hey|hi|hello)\s+[A-Za-z0-9_]+(?:\s*[,:]|(?:\s+-\s+)|\s+)",
-    )
     original = text.strip()
     stripped = text.lstrip()
     changed = True
     while changed:
         changed = False
-        for pattern in opener_patterns:
-            updated = re.sub(pattern, "", stripped, count=1, flags=re.IGNORECASE)
+        for pattern in CANNED_OPENER_PATTERNS:
+            updated = pattern.sub("", stripped, count=1)
             if updated != stripped:
                 stripped = updated.strip()
                 changed = True
@@ -324,17 +351,10 @@ def remove_canned_openers(text: str) -> str:
 
 
 def remove_canned_signoffs(text: str) -> str:
-    signoff_patterns = (
-        r"\n*\s*(?:let me know if you want more detail\.?)\s*$",
-        r"\n*\s*(?:hope that helps[.!]?)\s*$",
-        r"\n*\s*(?:feel free to ask if you want more\.?)\s*$",
-        r"\n*\s*(?:anything specific you wanted to know\??)\s*$",
-        r"\n*\s*(?:anything else\??)\s*$",
-    )
     original = text.strip()
     cleaned = text
-    for pattern in signoff_patterns:
-        cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
+    for pattern in CANNED_SIGNOFF_PATTERNS:
+        cleaned = pattern.sub("", cleaned)
     return cleaned.strip() or original
 
 
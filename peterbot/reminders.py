@@ -1,22 +1,47 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
+import itertools
 import json
 import logging
 import os
 import re
 import tempfile
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import discord
 
 from .config import resolve_data_directory
 from .logging_utils import (
+    log_error_with_context,
     log_exception_with_context,
     log_with_context,
     truncate_for_log,
 )
 
+REMINDER_DELIVERY_CONCURRENCY = 8
+REMINDER_EMBEDS_PER_MESSAGE = 10
+REMINDER_EMBED_CHARS_PER_MESSAGE = 6000
+REMINDER_EMBED_COLOR = 0xFFA500
+MISSED_REMINDER_EMBED_COLOR = 0xFF6B6B
+REMINDER_EMBED_FOOTER = "Reminder from PeterBot"
+
+RELATIVE_TIME_RE = re.compile(r"in\s+(\d+)\s*(seconds?|secs?|s|minutes?|mins?|m|hours?|hrs?|h|days?|d)")
+TOMORROW_RE = re.compile(r"tomorrow|tmrw?")
+CLOCK_TIME_PATTERN = r"(?P<hour>\d{1,2}):(?P<minute>\d{1,2})(?:\s*(?P<meridiem>[ap]m))?"
+TOMORROW_TIME_RE = re.compile(rf"tomorrow(?:\s+at)?\s+{CLOCK_TIME_PATTERN}", re.IGNORECASE)
+CLOCK_TIME_RE = re.compile(CLOCK_TIME_PATTERN, re.IGNORECASE)
+ISO_DATETIME_LENGTHS = frozenset({16, 19})
+REMINDER_DATE_RE = re.compile(
+    r"(?:(?P<iso_year>\d{4})-(?P<iso_month>\d{1,2})-(?P<iso_day>\d{1,2})"
+    r"|(?P<month>\d{1,2})(?P<sep>[/-])(?P<day>\d{1,2})(?:(?P=sep)(?P<year>\d{4}|\d{2}))?)"
+    rf"(?:\s+{CLOCK_TIME_PATTERN})?",
+    re.IGNORECASE,
+)
+
 
 def write_json_atomic(path: str, data: Any) -> None:
     directory = os.path.dirname(path) or "."
@@ -30,7 +55,7 @@ def write_json_atomic(path: str, data: Any) -> None:
             dir=directory,
             delete=False,
         ) as temp_file:
-            json.dump(data, temp_file)
+            json.dump(data, temp_file, separators=(",", ":"))
             temp_file.flush()
             os.fsync(temp_file.fileno())
             temp_path = temp_file.name
@@ -49,37 +74,87 @@ def write_json_atomic(path: str, data: Any) -> None:
                 )
 
 
+def utc_now() -> datetime:
+    return discord.utils.utcnow()
+
+
+def to_utc(value: datetime) -> datetime:
+    return value.astimezone(timezone.utc)
+
+
 class ReminderManager:
     def __init__(self, data_dir: Optional[str] = None) -> None:
-        self.reminders: List[Dict[str, Any]] = []
+        self._queue: List[Tuple[datetime, int, Dict[str, Any]]] = []
+        self._sequence = itertools.count()
+        self._dirty = False
+        self._save_lock: Optional[asyncio.Lock] = None
+        self._wake: Optional[asyncio.Event] = None
+        self.dm_channels: Dict[int, Any] = {}
         self.data_dir = resolve_data_directory(data_dir)
         self.reminders_file = os.path.join(self.data_dir, "reminders.json")
         self.shutdown_file = os.path.join(self.data_dir, "bot_shutdown.json")
         self.legacy_reminders_file = os.path.abspath(os.path.join(os.getcwd(), "reminders.json"))
         self.legacy_shutdown_file = os.path.abspath(os.path.join(os.getcwd(), "bot_shutdown.json"))
 
-    def _sort_reminders(self) -> None:
-        self.reminders.sort(key=lambda reminder: reminder["remind_time"])
+    @property
+    def reminders(self) -> List[Dict[str, Any]]:
+        return [reminder for _, _, reminder in sorted(self._queue)]
+
+    def _queue_entry(self, reminder: Dict[str, Any]) -> Tuple[datetime, int, Dict[str, Any]]:
+        return reminder["remind_time"], next(self._sequence), reminder
+
+    def _push_reminder(self, reminder: Dict[str, Any]) -> None:
+        entry = self._queue_entry(reminder)
+        heapq.heappush(self._queue, entry)
+        self._dirty = True
+        if self._queue[0] is entry:
+            self._wake_scheduler()
+
+    def _wake_scheduler(self) -> None:
+        if self._wake is not None:
+            self._wake.set()
+
+    def _serialize_reminders(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "user_id": reminder["user_id"],
+                "message": reminder["message"],
+                "remind_time": reminder["remind_time"].isoformat(),
+                "created_at": reminder["created_at"],
+            }
+            for _, _, reminder in self._queue
+        ]
 
     def save_reminders(self) -> None:
         try:
-            data = [
-                {
-                    "user_id": reminder["user_id"],
-                    "message": reminder["message"],
-                    "remind_time": reminder["remind_time"].isoformat(),
-                    "created_at": reminder["created_at"].isoformat(),
-                }
-                for reminder in self.reminders
-            ]
-            write_json_atomic(self.reminders_file, data)
+            write_json_atomic(self.reminders_file, self._serialize_reminders())
+            self._dirty = False
         except Exception:
             log_exception_with_context(
                 "Failed saving reminders",
                 reminders_file=self.reminders_file,
-                reminder_count=len(self.reminders),
+                reminder_count=len(self._queue),
             )
 
+    async def flush_reminders(self) -> None:
+        if self._save_lock is None:
+            self._save_lock = asyncio.Lock()
+
+        async with self._save_lock:
+            if not self._dirty:
+                return
+            data = self._serialize_reminders()
+            self._dirty = False
+            try:
+                await asyncio.to_thread(write_json_atomic, self.reminders_file, data)
+            except Exception:
+                self._dirty = True
+                log_exception_with_context(
+                    "Failed saving reminders",
+                    reminders_file=self.reminders_file,
+                    reminder_count=len(data),
+                )
+
     def _load_json_with_legacy_fallback(
         self,
         primary_path: str,
@@ -109,28 +184,33 @@ class ReminderManager:
             if data is None:
                 return
             if not isinstance(data, list):
-                self.reminders = []
+                self._queue = []
                 return
 
-            loaded: List[Dict[str, Any]] = []
+            from_iso = datetime.fromisoformat
+            queue_entry = self._queue_entry
+            loaded: List[Tuple[datetime, int, Dict[str, Any]]] = []
             for reminder in data:
                 try:
                     loaded.append(
-                        {
-                            "user_id": reminder["user_id"],
-                            "message": reminder["message"],
-                            "remind_time": datetime.fromisoformat(reminder["remind_time"]),
-                            "created_at": datetime.fromisoformat(reminder["created_at"]),
-                        }
+                        queue_entry(
+                            {
+                                "user_id": reminder["user_id"],
+                                "message": reminder["message"],
+                                "remind_time": to_utc(from_iso(reminder["remind_time"])),
+                                "created_at": str(reminder["created_at"]),
+                            }
+                        )
                     )
                 except (KeyError, ValueError, TypeError):
                     continue
-            self.reminders = loaded
-            self._sort_reminders()
+            heapq.heapify(loaded)
+            self._queue = loaded
             log_with_context(
                 logging.INFO,
                 "Loaded reminders",
-                reminder_count=len(self.reminders),
+                reminder_count=len(self._queue),
+                dropped_count=len(data) - len(loaded),
                 source_path=source_path,
             )
         except Exception:
@@ -139,13 +219,17 @@ class ReminderManager:
                 reminders_file=self.reminders_file,
                 legacy_reminders_file=self.legacy_reminders_file,
             )
-            self.reminders = []
+            self._queue = []
+
+    async def restore_reminders(self) -> None:
+        await asyncio.to_thread(self.load_reminders)
+        self._wake_scheduler()
 
     def save_shutdown_time(self) -> None:
         try:
             write_json_atomic(
                 self.shutdown_file,
-                {"shutdown_time": datetime.now().isoformat()},
+                {"shutdown_time": utc_now().isoformat()},
             )
         except Exception:
             log_exception_with_context(
@@ -164,7 +248,7 @@ class ReminderManager:
             if not isinstance(data, dict) or "shutdown_time" not in data:
                 return None
 
-            downtime = datetime.now() - datetime.fromisoformat(data["shutdown_time"])
+            downtime = utc_now() - to_utc(datetime.fromisoformat(data["shutdown_time"]))
             if source_path and os.path.exists(source_path):
                 os.remove(source_path)
             return downtime
@@ -177,32 +261,57 @@ class ReminderManager:
             return None
 
     def add_reminder(self, user_id: int, message: str, remind_time: datetime) -> None:
-        self.reminders.append(
+        self._push_reminder(
             {
                 "user_id": user_id,
                 "message": message,
-                "remind_time": remind_time,
-                "created_at": datetime.now(),
+                "remind_time": to_utc(remind_time),
+                "created_at": utc_now().isoformat(),
             }
         )
-        self._sort_reminders()
-        self.save_reminders()
 
-    def pop_due_reminders(self) -> List[Dict[str, Any]]:
-        now = datetime.now()
-        due = [reminder for reminder in self.reminders if reminder["remind_time"] <= now]
-        self.reminders = [reminder for reminder in self.reminders if reminder["remind_time"] > now]
+    @property
+    def next_due(self) -> Optional[datetime]:
+        return self._queue[0][0] if self._queue else None
+
+    def pop_due_reminders(self, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        if not self._queue:
+            return []
+        now = utc_now() if now is None else to_utc(now)
+        if self._queue[0][0] > now:
+            return []
+
+        due: List[Dict[str, Any]] = []
+        while self._queue and self._queue[0][0] <= now:
+            due.append(heapq.heappop(self._queue)[2])
+        if due:
+            self._dirty = True
         return due
 
     def requeue_reminder(
         self,
         reminder: Dict[str, Any],
         delay: timedelta,
+        *,
+        now: Optional[datetime] = None,
     ) -> None:
         updated = reminder.copy()
-        updated["remind_time"] = datetime.now() + delay
-        self.reminders.append(updated)
-        self._sort_reminders()
+        updated["remind_time"] = (utc_now() if now is None else to_utc(now)) + delay
+        self._push_reminder(updated)
+
+    async def wait_until_due(self, max_wait_seconds: float) -> None:
+        if self._wake is None:
+            self._wake = asyncio.Event()
+        self._wake.clear()
+
+        timeout = max_wait_seconds
+        next_due = self.next_due
+        if next_due is not None:
+            timeout = min(timeout, max(0.0, (next_due - utc_now()).total_seconds()))
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
 
     def format_duration(self, duration: timedelta) -> str:
         total_seconds = max(0, int(duration.total_seconds()))
@@ -236,14 +345,19 @@ async def resolve_user(bot: Any, user_id: int) -> Optional[discord.User]:
     return None
 
 
+def format_reminder_time(value: datetime) -> str:
+    return f"{value.month:02d}/{value.day:02d}/{value.year} {value.hour:02d}:{value.minute:02d}"
+
+
 def build_reminder_embed(
     manager: ReminderManager,
     reminder: Dict[str, Any],
     *,
     missed: bool,
     downtime: Optional[timedelta] = None,
+    now: Optional[datetime] = None,
 ) -> discord.Embed:
-    now = datetime.now()
+    now = utc_now() if now is None else now
     if missed:
         delay = now - reminder["remind_time"]
         embed = discord.Embed(
@@ -252,7 +366,7 @@ def build_reminder_embed(
                 "I was offline when this reminder was due.\n\n"
                 f"**Original reminder:** {reminder['message']}"
             ),
-            color=0xFF6B6B,
+            color=MISSED_REMINDER_EMBED_COLOR,
             timestamp=now,
         )
         embed.add_field(
@@ -267,52 +381,154 @@ def build_reminder_embed(
         )
         embed.add_field(
             name="Original time",
-            value=reminder["remind_time"].strftime("%m/%d/%Y %H:%M"),
+            value=format_reminder_time(reminder["remind_time"].astimezone()),
             inline=False,
         )
     else:
         embed = discord.Embed(
             title="Reminder",
             description=reminder["message"],
-            color=0xFFA500,
+            color=REMINDER_EMBED_COLOR,
             timestamp=now,
         )
-    embed.set_footer(text="Reminder from PeterBot")
+    embed.set_footer(text=REMINDER_EMBED_FOOTER)
     return embed
 
 
-async def deliver_reminder(
+def batch_reminder_embeds(embeds: List[discord.Embed]) -> List[Tuple[int, int]]:
+    batches: List[Tuple[int, int]] = []
+    start = 0
+    batch_chars = 0
+    for index, embed in enumerate(embeds):
+        embed_chars = len(embed)
+        if index > start and (
+            index - start >= REMINDER_EMBEDS_PER_MESSAGE
+            or batch_chars + embed_chars > REMINDER_EMBED_CHARS_PER_MESSAGE
+        ):
+            batches.append((start, index))
+            start = index
+            batch_chars = 0
+        batch_chars += embed_chars
+    if start < len(embeds):
+        batches.append((start, len(embeds)))
+    return batches
+
+
+async def deliver_user_reminders(
     bot: Any,
     manager: ReminderManager,
-    reminder: Dict[str, Any],
+    user_id: int,
+    reminders: List[Dict[str, Any]],
     *,
     missed: bool,
     downtime: Optional[timedelta] = None,
-) -> str:
-    user = await resolve_user(bot, reminder["user_id"])
-    if not user:
-        return "drop"
+    now: Optional[datetime] = None,
+) -> List[str]:
+    channel = manager.dm_channels.get(user_id)
+    user = None
+    if channel is None:
+        user = await resolve_user(bot, user_id)
+        if not user:
+            return ["drop"] * len(reminders)
+
+    embeds = [
+        build_reminder_embed(manager, reminder, missed=missed, downtime=downtime, now=now)
+        for reminder in reminders
+    ]
+    statuses: List[str] = []
+    for start, stop in batch_reminder_embeds(embeds):
+        batch = reminders[start:stop]
+        try:
+            if channel is None:
+                channel = user.dm_channel or await user.create_dm()
+                manager.dm_channels[user_id] = channel
+            await channel.send(embeds=embeds[start:stop])
+            statuses.extend(["sent"] * len(batch))
+        except discord.Forbidden:
+            manager.dm_channels.pop(user_id, None)
+            log_with_context(
+                logging.INFO,
+                "Cannot DM user; dropping reminders",
+                user_id=user_id,
+                reminder_count=len(reminders) - len(statuses),
+                reminder_preview=truncate_for_log(batch[0].get("message")),
+            )
+            return statuses + ["drop"] * (len(reminders) - len(statuses))
+        except discord.HTTPException as exc:
+            manager.dm_channels.pop(user_id, None)
+            if 400 <= exc.status < 500 and exc.status != 429:
+                log_error_with_context(
+                    "Discord rejected reminder message; dropping reminders",
+                    user_id=user_id,
+                    reminder_count=len(batch),
+                    status=exc.status,
+                    error=truncate_for_log(exc.text),
+                )
+                statuses.extend(["drop"] * len(batch))
+                continue
+            log_exception_with_context(
+                "Transient Discord error while sending reminders",
+                user_id=user_id,
+                reminder_count=len(reminders) - len(statuses),
+                remind_time=batch[0].get("remind_time"),
+                missed=missed,
+            )
+            return statuses + ["retry"] * (len(reminders) - len(statuses))
+    return statuses
 
-    embed = build_reminder_embed(manager, reminder, missed=missed, downtime=downtime)
-    try:
-        await user.send(embed=embed)
-        return "sent"
-    except discord.Forbidden:
-        log_with_context(
-            logging.INFO,
-            "Cannot DM user; dropping reminder",
-            user_id=reminder["user_id"],
-            reminder_preview=truncate_for_log(reminder.get("message")),
-        )
-        return "drop"
-    except discord.HTTPException:
-        log_exception_with_context(
-            "Transient Discord error while sending reminder",
-            user_id=reminder["user_id"],
-            remind_time=reminder.get("remind_time"),
-            missed=missed,
-        )
-        return "retry"
+
+async def deliver_reminders(
+    bot: Any,
+    manager: ReminderManager,
+    reminders: List[Dict[str, Any]],
+    *,
+    missed: bool,
+    retry_delay: timedelta,
+    now: datetime,
+    downtime: Optional[timedelta] = None,
+) -> int:
+    reminders_by_user: Dict[int, List[Dict[str, Any]]] = {}
+    for reminder in reminders:
+        reminders_by_user.setdefault(reminder["user_id"], []).append(reminder)
+
+    delivery_slots = asyncio.Semaphore(REMINDER_DELIVERY_CONCURRENCY)
+
+    async def deliver_with_slot(user_id: int, user_reminders: List[Dict[str, Any]]) -> List[str]:
+        async with delivery_slots:
+            return await deliver_user_reminders(
+                bot,
+                manager,
+                user_id,
+                user_reminders,
+                missed=missed,
+                downtime=downtime,
+                now=now,
+            )
+
+    results = await asyncio.gather(
+        *(
+            deliver_with_slot(user_id, user_reminders)
+            for user_id, user_reminders in reminders_by_user.items()
+        ),
+        return_exceptions=True,
+    )
+    retry_count = 0
+    for (user_id, user_reminders), statuses in zip(reminders_by_user.items(), results):
+        if isinstance(statuses, BaseException):
+            log_with_context(
+                logging.ERROR,
+                "Unexpected error while delivering reminders",
+                user_id=user_id,
+                reminder_count=len(user_reminders),
+                missed=missed,
+                error=repr(statuses),
+            )
+            statuses = ["retry"] * len(user_reminders)
+        for reminder, status in zip(user_reminders, statuses):
+            if status == "retry":
+                manager.requeue_reminder(reminder, retry_delay, now=now)
+                retry_count += 1
+    return retry_count
 
 
 async def check_missed_reminders(
@@ -321,8 +537,9 @@ async def check_missed_reminders(
     *,
     retry_delay: timedelta,
 ) -> None:
-    downtime = manager.get_downtime()
-    missed_reminders = manager.pop_due_reminders()
+    downtime = await asyncio.to_thread(manager.get_downtime)
+    now = utc_now()
+    missed_reminders = manager.pop_due_reminders(now)
     if not missed_reminders:
         return
 
@@ -333,20 +550,16 @@ async def check_missed_reminders(
         downtime=manager.format_duration(downtime) if downtime else None,
     )
 
-    retry_count = 0
-    for reminder in missed_reminders:
-        status = await deliver_reminder(
-            bot,
-            manager,
-            reminder,
-            missed=True,
-            downtime=downtime,
-        )
-        if status == "retry":
-            manager.requeue_reminder(reminder, retry_delay)
-            retry_count += 1
-
-    manager.save_reminders()
+    retry_count = await deliver_reminders(
+        bot,
+        manager,
+        missed_reminders,
+        missed=True,
+        retry_delay=retry_delay,
+        now=now,
+        downtime=downtime,
+    )
+    await manager.flush_reminders()
     if retry_count:
         log_with_context(
             logging.INFO,
@@ -355,158 +568,141 @@ async def check_missed_reminders(
         )
 
 
-def add_one_year(dt: datetime) -> datetime:
-    try:
-        return dt.replace(year=dt.year + 1)
-    except ValueError:
-        return dt.replace(year=dt.year + 1, month=2, day=28)
+def next_yearly_date(month: int, day: int, hour: int, minute: int, now: datetime) -> Optional[datetime]:
+    for year in range(now.year, now.year + 9):
+        try:
+            target = datetime(year, month, day, hour, minute)
+        except ValueError:
+            continue
+        if target > now:
+            return target
+    return None
 
 
-def normalize_2_digit_year(dt: datetime) -> datetime:
-    if dt.year < 2000:
-        return dt.replace(year=dt.year + 100)
-    return dt
+def clock_time_from_match(match: re.Match[str]) -> Optional[tuple[int, int]]:
+    hour = int(match.group("hour"))
+    minute = int(match.group("minute"))
+    meridiem = match.group("meridiem")
+    if minute > 59:
+        return None
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+        hour %= 12
+        if meridiem.lower() == "pm":
+            hour += 12
+    elif hour > 23:
+        return None
+    return hour, minute
 
 
-def parse_reminder_time(time_str: str, now: Optional[datetime] = None) -> Optional[datetime]:
-    if now is None:
-        now = datetime.now()
+def resolve_relative_match(match: re.Match[str], now: datetime) -> Optional[datetime]:
+    amount = int(match.group(1))
+    unit = match.group(2)
+    if amount <= 0:
+        return None
+    if unit.startswith(("second", "sec", "s")):
+        return now + timedelta(seconds=amount)
+    if unit.startswith(("minute", "min", "m")):
+        return now + timedelta(minutes=amount)
+    if unit.startswith(("hour", "hr", "h")):
+        return now + timedelta(hours=amount)
+    return now + timedelta(days=amount)
 
-    raw = time_str.strip()
-    if not raw:
+
+def resolve_tomorrow_match(match: re.Match[str], now: datetime) -> Optional[datetime]:
+    return (now + timedelta(days=1)).replace(second=0, microsecond=0)
+
+
+def resolve_tomorrow_time_match(match: re.Match[str], now: datetime) -> Optional[datetime]:
+    clock_time = clock_time_from_match(match)
+    if clock_time is None:
         return None
+    return (now + timedelta(days=1)).replace(
+        hour=clock_time[0],
+        minute=clock_time[1],
+        second=0,
+        microsecond=0,
+    )
 
-    lowered = raw.lower()
 
-    relative_match = re.fullmatch(
-        r"in\s+(\d+)\s*(seconds?|secs?|s|minutes?|mins?|m|hours?|hrs?|h|days?|d)",
-        lowered,
+def resolve_clock_match(match: re.Match[str], now: datetime) -> Optional[datetime]:
+    clock_time = clock_time_from_match(match)
+    if clock_time is None:
+        return None
+    target = now.replace(
+        hour=clock_time[0],
+        minute=clock_time[1],
+        second=0,
+        microsecond=0,
     )
-    if relative_match:
-        amount = int(relative_match.group(1))
-        unit = relative_match.group(2)
-        if amount <= 0:
+    if target <= now:
+        target += timedelta(days=1)
+    return target
+
+
+def resolve_calendar_match(match: re.Match[str], now: datetime) -> Optional[datetime]:
+    if match.group("hour") is None:
+        hour, minute = now.hour, now.minute
+    else:
+        clock_time = clock_time_from_match(match)
+        if clock_time is None:
             return None
-        if unit.startswith(("second", "sec", "s")):
-            return now + timedelta(seconds=amount)
-        if unit.startswith(("minute", "min", "m")):
-            return now + timedelta(minutes=amount)
-        if unit.startswith(("hour", "hr", "h")):
-            return now + timedelta(hours=amount)
-        return now + timedelta(days=amount)
-
-    if lowered in {"tomorrow", "tmr", "tmrw"}:
-        return (now + timedelta(days=1)).replace(second=0, microsecond=0)
-
-    tomorrow_with_time = re.fullmatch(r"tomorrow(?:\s+at)?\s+(.+)", lowered)
-    if tomorrow_with_time:
-        time_part = tomorrow_with_time.group(1)
-        for fmt in ("%H:%M", "%I:%M %p", "%I:%M%p"):
-            try:
-                parsed_time = datetime.strptime(time_part, fmt)
-                return (now + timedelta(days=1)).replace(
-                    hour=parsed_time.hour,
-                    minute=parsed_time.minute,
-                    second=0,
-                    microsecond=0,
-                )
-            except ValueError:
-                continue
+        hour, minute = clock_time
 
-    date_time_with_year = [
-        "%m/%d/%Y %H:%M",
-        "%m-%d-%Y %H:%M",
-        "%Y-%m-%d %H:%M",
-        "%m/%d/%Y %I:%M %p",
-        "%m/%d/%Y %I:%M%p",
-        "%m-%d-%Y %I:%M %p",
-        "%m-%d-%Y %I:%M%p",
-        "%Y-%m-%d %I:%M %p",
-        "%Y-%m-%d %I:%M%p",
-        "%m/%d/%y %H:%M",
-        "%m-%d-%y %H:%M",
-        "%m/%d/%y %I:%M %p",
-        "%m/%d/%y %I:%M%p",
-        "%m-%d-%y %I:%M %p",
-        "%m-%d-%y %I:%M%p",
-    ]
-    for fmt in date_time_with_year:
-        try:
-            parsed = datetime.strptime(raw, fmt)
-            if "%y" in fmt:
-                parsed = normalize_2_digit_year(parsed)
-            return parsed
-        except ValueError:
-            continue
+    year_text = match.group("iso_year") or match.group("year")
+    month = int(match.group("iso_month") or match.group("month"))
+    day = int(match.group("iso_day") or match.group("day"))
+    try:
+        if year_text is None:
+            return next_yearly_date(month, day, hour, minute, now)
 
-    date_time_without_year = [
-        "%m/%d %H:%M",
-        "%m-%d %H:%M",
-        "%m/%d %I:%M %p",
-        "%m/%d %I:%M%p",
-        "%m-%d %I:%M %p",
-        "%m-%d %I:%M%p",
-    ]
-    for fmt in date_time_without_year:
-        try:
-            parsed = datetime.strptime(raw, fmt)
-            target = parsed.replace(year=now.year, second=0, microsecond=0)
-            if target <= now:
-                target = add_one_year(target)
-            return target
-        except ValueError:
-            continue
+        year = int(year_text)
+        if len(year_text) == 2:
+            year += 2000
+        return datetime(year, month, day, hour, minute)
+    except ValueError:
+        return None
 
-    date_only_with_year = [
-        "%m/%d/%Y",
-        "%m-%d-%Y",
-        "%Y-%m-%d",
-        "%m/%d/%y",
-        "%m-%d-%y",
-    ]
-    for fmt in date_only_with_year:
-        try:
-            parsed = datetime.strptime(raw, fmt)
-            if "%y" in fmt:
-                parsed = normalize_2_digit_year(parsed)
-            return parsed.replace(
-                hour=now.hour,
-                minute=now.minute,
-                second=0,
-                microsecond=0,
-            )
-        except ValueError:
-            continue
 
-    for fmt in ("%m/%d", "%m-%d"):
-        try:
-            parsed = datetime.strptime(raw, fmt)
-            target = parsed.replace(
-                year=now.year,
-                hour=now.hour,
-                minute=now.minute,
-                second=0,
-                microsecond=0,
-            )
-            if target <= now:
-                target = add_one_year(target)
-            return target
-        except ValueError:
-            continue
+ReminderTimeResolver = Callable[[re.Match, datetime], Optional[datetime]]
+
+REMINDER_TIME_PARSERS: Tuple[Tuple[re.Pattern[str], ReminderTimeResolver], ...] = (
+    (RELATIVE_TIME_RE, resolve_relative_match),
+    (TOMORROW_RE, resolve_tomorrow_match),
+    (TOMORROW_TIME_RE, resolve_tomorrow_time_match),
+    (REMINDER_DATE_RE, resolve_calendar_match),
+    (CLOCK_TIME_RE, resolve_clock_match),
+)
+
+
+@lru_cache(maxsize=512)
+def match_reminder_time(lowered: str) -> Optional[Tuple[re.Match[str], ReminderTimeResolver]]:
+    for pattern, resolver in REMINDER_TIME_PARSERS:
+        match = pattern.fullmatch(lowered)
+        if match:
+            return match, resolver
+    return None
 
-    for fmt in ("%H:%M", "%I:%M %p", "%I:%M%p"):
+
+def parse_reminder_time(time_str: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    if now is None:
+        now = datetime.now()
+
+    raw = time_str.strip()
+    if not raw:
+        return None
+
+    if len(raw) in ISO_DATETIME_LENGTHS and raw[4] == "-" and raw[10] in " T":
         try:
-            parsed_time = datetime.strptime(raw, fmt)
-            target = now.replace(
-                hour=parsed_time.hour,
-                minute=parsed_time.minute,
-                second=0,
-                microsecond=0,
-            )
-            if target <= now:
-                target += timedelta(days=1)
-            return target
+            parsed = datetime.fromisoformat(raw)
         except ValueError:
-            continue
+            parsed = None
+        if parsed is not None and parsed.tzinfo is None:
+            return parsed
 
-    return None
+    matched = match_reminder_time(raw.lower())
+    if matched is None:
+        return None
+    match, resolver = matched
+    return resolver(match, now)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import weakref
+from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Any
+from typing import Any, Optional
 
 from .config import AppConfig
+from .context import ChannelMessageCache
 from .knowledge import KnowledgeIndex
 from .ollama_client import OllamaChatClient
 from .reminders import ReminderManager
@@ -18,5 +21,8 @@ class PeterBotRuntime:
     reminder_manager: ReminderManager
     knowledge_index: KnowledgeIndex
     retry_delay: timedelta
+    channel_cache: ChannelMessageCache
     has_initialized: bool = False
     has_synced_commands: bool = False
+    user_request_locks: weakref.WeakValueDictionary[int, asyncio.Lock] = field(default_factory=weakref.WeakValueDictionary)
+    reminder_task: Optional[asyncio.Task] = None
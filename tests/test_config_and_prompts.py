@@ -1,5 +1,11 @@
+import asyncio
 import json
+import logging
+from dataclasses import replace
 from pathlib import Path
+from types import SimpleNamespace
+
+import aiohttp
 
 from peterbot.config import (
     AppConfig,
@@ -7,9 +13,17 @@ from peterbot.config import (
     load_app_environment,
     resolve_data_directory,
     resolve_model_profile,
+    warn_invalid_env_ints,
 )
 from peterbot.knowledge import build_knowledge_excerpt, load_channel_profiles, load_knowledge_chunks, rank_knowledge_chunks
-from peterbot.prompts import MENTION_MODE, build_context_line, build_system_prompt, cleanup_response_text
+from peterbot.ollama_client import OllamaChatClient, build_ollama_options, build_ollama_payload
+from peterbot.prompts import (
+    MENTION_MODE,
+    add_no_think_suffix,
+    build_context_line,
+    build_system_prompt,
+    cleanup_response_text,
+)
 
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -216,3 +230,109 @@ def test_custom_persona_seed_cannot_override_hard_style_rules(tmp_path) -> None:
     assert "super warm best friend who acts human" in prompt
     assert "You are the club bot or assistant, not a human member of the server." in prompt
     assert "Do not ask a follow up question unless clarification is actually required." in prompt
+
+
+def test_app_config_reads_ollama_timeout_tiers_and_retries(monkeypatch) -> None:
+    monkeypatch.setenv("OLLAMA_OPTIONS_JSON", "{}")
+    monkeypatch.setenv("OLLAMA_CONNECT_TIMEOUT_SECONDS", "5")
+    monkeypatch.setenv("OLLAMA_READ_TIMEOUT_SECONDS", "120")
+    monkeypatch.setenv("OLLAMA_MAX_RETRIES", "0")
+
+    config = AppConfig.from_env()
+
+    assert config.ollama_connect_timeout_seconds == 5
+    assert config.ollama_read_timeout_seconds == 120
+    assert config.ollama_max_retries == 0
+
+    monkeypatch.setenv("OLLAMA_READ_TIMEOUT_SECONDS", "")
+    monkeypatch.setenv("OLLAMA_MAX_RETRIES", "-1")
+
+    config = AppConfig.from_env()
+
+    assert config.ollama_read_timeout_seconds is None
+    assert config.ollama_max_retries == 2
+
+
+def test_invalid_integer_env_values_are_warned_after_config_parse(monkeypatch, caplog) -> None:
+    monkeypatch.setenv("OLLAMA_OPTIONS_JSON", "{}")
+    monkeypatch.setenv("OLLAMA_NUM_CTX", "8k")
+    monkeypatch.setenv("OLLAMA_MAX_RETRIES", "3")
+
+    with caplog.at_level(logging.WARNING):
+        config = AppConfig.from_env()
+        assert config.ollama_num_ctx == 8192
+        assert not caplog.records
+
+        warn_invalid_env_ints()
+
+    assert len(caplog.records) == 1
+    assert "OLLAMA_NUM_CTX" in caplog.records[0].getMessage()
+
+
+def test_keep_alive_sends_bare_numbers_as_seconds(monkeypatch) -> None:
+    monkeypatch.setenv("OLLAMA_OPTIONS_JSON", "{}")
+    monkeypatch.setenv("OLLAMA_KEEP_ALIVE", "3600")
+    monkeypatch.setenv("PETER_OLLAMA_KEEP_ALIVE", "-1")
+    config = AppConfig.from_env()
+    assert config.ollama_keep_alive == -1
+    assert build_ollama_payload("qwen3.5", [], keep_alive=config.ollama_keep_alive)["keep_alive"] == -1
+
+    monkeypatch.setenv("PETER_OLLAMA_KEEP_ALIVE", " 1h ")
+    assert AppConfig.from_env().ollama_keep_alive == "1h"
+
+    monkeypatch.setenv("PETER_OLLAMA_KEEP_ALIVE", "")
+    config = AppConfig.from_env()
+    assert "keep_alive" not in build_ollama_payload("qwen3.5", [], keep_alive=config.ollama_keep_alive)
+
+
+def test_ollama_options_bound_generation_but_respect_explicit_options(tmp_path) -> None:
+    config = build_config(tmp_path)
+    options = build_ollama_options(config)
+    assert options == {"num_predict": 384, "num_ctx": 8192, "temperature": 0.3}
+
+    overridden = build_ollama_options(replace(config, ollama_options={"num_predict": 1024}))
+    assert overridden["num_predict"] == 1024
+
+    payload = build_ollama_payload("qwen3.5", [], options=options, keep_alive=config.ollama_keep_alive)
+    assert payload["keep_alive"] == "30m"
+    assert "keep_alive" not in payload["options"]
+
+
+def test_add_no_think_suffix_only_checks_the_prompt_tail() -> None:
+    assert add_no_think_suffix("what gpu fits? \n") == "what gpu fits? /no_think"
+    assert add_no_think_suffix("already tagged /no_think  ") == "already tagged /no_think  "
+    assert add_no_think_suffix("quoted /no_think earlier") == "quoted /no_think earlier /no_think"
+    assert add_no_think_suffix("let it reason", allow_thinking=True) == "let it reason"
+
+
+def test_ollama_client_retries_connect_failures_but_not_read_stalls(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("peterbot.ollama_client.OLLAMA_RETRY_BASE_DELAY_SECONDS", 0)
+    client = OllamaChatClient(replace(build_config(tmp_path), ollama_max_retries=2))
+    attempts = []
+
+    class FailingPost:
+        def __init__(self, error: Exception) -> None:
+            self.error = error
+
+        async def __aenter__(self):
+            raise self.error
+
+        async def __aexit__(self, *exc_info) -> None:
+            return None
+
+    def run_with(error: Exception) -> str:
+        attempts.clear()
+
+        def post(url, json):
+            attempts.append(url)
+            return FailingPost(error)
+
+        client.http_session = SimpleNamespace(closed=False, post=post)
+        client.request_slots = asyncio.Semaphore(1)
+        return asyncio.run(client.call_chat("hello", system_prompt="sys"))
+
+    assert "too long" in run_with(aiohttp.SocketTimeoutError("read stalled"))
+    assert len(attempts) == 1
+
+    run_with(aiohttp.ConnectionTimeoutError("connect timed out"))
+    assert len(attempts) == 3
@@ -1,12 +1,18 @@
+import asyncio
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from types import SimpleNamespace
 
+from peterbot.app import build_channel_cache
+from peterbot.config import AppConfig
 from peterbot.context import (
+    ChannelMessageCache,
     build_current_mention_prompt_text,
     build_mention_context_bundle,
+    fetch_recent_messages,
     prompt_requires_strong_target,
+    split_for_discord,
 )
 
 
@@ -156,3 +162,70 @@ def test_image_only_mention_builds_natural_prompt_and_attachment_note() -> None:
     prompt = build_current_mention_prompt_text(message, bot_user_id=999)
     assert prompt.startswith("What do you think about this?")
     assert "[attachments: case-photo.png]" in prompt
+
+
+def test_channel_message_cache_only_answers_when_it_holds_enough_history() -> None:
+    cache = ChannelMessageCache(max_messages_per_channel=5)
+    channel = SimpleNamespace(id=10)
+    start = datetime(2026, 3, 10, 12, 0, 0)
+    for index in range(7):
+        cache.add(SimpleNamespace(id=index, channel=channel, created_at=start + timedelta(minutes=index)))
+
+    recent = cache.recent(10, limit=3, before=start + timedelta(minutes=6))
+    assert [msg.id for msg in recent] == [5, 4, 3]
+    assert cache.recent(10, limit=5, before=start + timedelta(minutes=6)) is None
+    assert cache.recent(11, limit=1) is None
+
+    cache.remove(10, [4])
+    assert [msg.id for msg in cache.recent(10, limit=3)] == [6, 5, 3]
+
+    cache.clear()
+    assert cache.recent(10, limit=1) is None
+
+
+def test_channel_message_cache_applies_edits_by_id() -> None:
+    cache = ChannelMessageCache(max_messages_per_channel=5)
+    channel = SimpleNamespace(id=10)
+    start = datetime(2026, 3, 10, 12, 0, 0)
+    for index in range(3):
+        cache.add(SimpleNamespace(id=index, channel=channel, content=f"old {index}", created_at=start + timedelta(minutes=index)))
+
+    edited = SimpleNamespace(id=1, channel=channel, content="new 1", created_at=start + timedelta(minutes=1))
+    cache.replace(10, 1, edited)
+    assert [msg.content for msg in cache.recent(10, limit=3)] == ["old 2", "new 1", "old 0"]
+
+    cache.replace(10, 0, None)
+    assert [msg.id for msg in cache.recent(10, limit=2)] == [2, 1]
+    assert cache.recent(10, limit=3) is None
+
+    cache.replace(11, 2, edited)
+    cache.replace(10, 99, edited)
+    assert [msg.id for msg in cache.recent(10, limit=2)] == [2, 1]
+
+
+def test_channel_cache_serves_mention_context_before_the_triggering_message() -> None:
+    config = AppConfig.from_env()
+    cache = build_channel_cache(config)
+    history_calls = []
+
+    def history(**kwargs):
+        history_calls.append(kwargs)
+        raise AssertionError("history should not be fetched")
+
+    channel = SimpleNamespace(id=10, history=history)
+    start = datetime(2026, 3, 10, 12, 0, 0)
+    for index in range(200):
+        cache.add(SimpleNamespace(id=index, channel=channel, created_at=start + timedelta(seconds=index)))
+    newest = start + timedelta(seconds=199)
+
+    for limit in (config.channel_context_limit, config.mention_context_fetch_limit, config.recap_max_messages):
+        recent = asyncio.run(fetch_recent_messages(channel, limit=limit, before=newest, cache=cache))
+        assert [msg.id for msg in recent] == list(range(198, 198 - limit, -1))
+    assert history_calls == []
+
+
+def test_split_for_discord_prefers_line_then_word_boundaries() -> None:
+    assert split_for_discord("") == ["(No response)"]
+    assert split_for_discord("  short reply \n") == ["short reply"]
+    assert split_for_discord("alpha beta\ngamma delta epsilon", max_len=12) == ["alpha beta", "gamma delta", "epsilon"]
+    assert split_for_discord("x" * 25, max_len=10) == ["x" * 10, "x" * 10, "x" * 5]
@@ -1,8 +1,10 @@
+import asyncio
+import weakref
 from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
 
-from peterbot.commands import build_prompt_artifacts, clamp_recap_count
+from peterbot.commands import build_prompt_artifacts, clamp_recap_count, get_user_request_lock
 from peterbot.config import AppConfig, ModelProfile
 from peterbot.context import build_recap_history
 from peterbot.knowledge import (
@@ -101,3 +103,21 @@ def test_recap_prompt_artifacts_skip_channel_profile_and_knowledge(tmp_path) ->
     assert knowledge_chunks == []
     assert "Relevant club knowledge:" not in system_prompt
     assert "Channel profile:" not in system_prompt
+
+
+def test_user_request_locks_are_shared_while_held_and_released_afterwards() -> None:
+    runtime = SimpleNamespace(user_request_locks=weakref.WeakValueDictionary())
+    order = []
+
+    async def request(label: str) -> None:
+        async with get_user_request_lock(runtime, 7):
+            order.append(f"{label} start")
+            await asyncio.sleep(0)
+            order.append(f"{label} end")
+
+    async def scenario() -> None:
+        await asyncio.gather(request("first"), request("second"))
+
+    asyncio.run(scenario())
+    assert order == ["first start", "first end", "second start", "second end"]
+    assert len(runtime.user_request_locks) == 0
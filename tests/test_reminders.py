@@ -1,8 +1,12 @@
+import asyncio
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from types import SimpleNamespace
 
-from peterbot.reminders import ReminderManager, parse_reminder_time
+import discord
+
+from peterbot.reminders import ReminderManager, deliver_reminders, deliver_user_reminders, parse_reminder_time
 
 
 def test_parse_reminder_time_core_formats() -> None:
@@ -13,6 +17,37 @@ def test_parse_reminder_time_core_formats() -> None:
     assert parse_reminder_time("in 0 minutes", now=now) is None
 
 
+def test_parse_reminder_time_date_shapes_without_strptime() -> None:
+    now = datetime(2028, 2, 20, 12, 0, 0)
+    assert parse_reminder_time("2028-03-01 14:30", now=now) == datetime(2028, 3, 1, 14, 30, 0)
+    assert parse_reminder_time("2028-03-01T14:30:45", now=now) == datetime(2028, 3, 1, 14, 30, 45)
+    assert parse_reminder_time("3-1-2028 2:30pm", now=now) == datetime(2028, 3, 1, 14, 30, 0)
+    assert parse_reminder_time("03/01/28", now=now) == datetime(2028, 3, 1, 12, 0, 0)
+    assert parse_reminder_time("02/29 9:00 AM", now=now) == datetime(2028, 2, 29, 9, 0, 0)
+    assert parse_reminder_time("01/05", now=now) == datetime(2029, 1, 5, 12, 0, 0)
+    assert parse_reminder_time("12:00 AM", now=now) == datetime(2028, 2, 21, 0, 0, 0)
+    assert parse_reminder_time("03/01-2028", now=now) is None
+    assert parse_reminder_time("13:30 PM", now=now) is None
+    assert parse_reminder_time("02/30/2028 10:00", now=now) is None
+
+
+def test_parse_reminder_time_yearless_feb_29_finds_next_leap_year() -> None:
+    assert parse_reminder_time("02/29", now=datetime(2026, 10, 15, 12, 0, 0)) == datetime(2028, 2, 29, 12, 0, 0)
+    assert parse_reminder_time("02/29 9:00 AM", now=datetime(2028, 3, 1, 12, 0, 0)) == datetime(2032, 2, 29, 9, 0, 0)
+    assert parse_reminder_time("02/29", now=datetime(2097, 1, 1, 12, 0, 0)) == datetime(2104, 2, 29, 12, 0, 0)
+    assert parse_reminder_time("02/30", now=datetime(2026, 10, 15, 12, 0, 0)) is None
+
+
+def test_parse_reminder_time_relative_and_tomorrow_shapes() -> None:
+    now = datetime(2026, 3, 10, 12, 0, 30)
+    assert parse_reminder_time("In 2 Hrs", now=now) == datetime(2026, 3, 10, 14, 0, 30)
+    assert parse_reminder_time("in 10 secs", now=now) == datetime(2026, 3, 10, 12, 0, 40)
+    assert parse_reminder_time("TMRW", now=now) == datetime(2026, 3, 11, 12, 0, 0)
+    assert parse_reminder_time("tomorrow 7:05 am", now=now) == datetime(2026, 3, 11, 7, 5, 0)
+    assert parse_reminder_time("tomorrow at 25:00", now=now) is None
+    assert parse_reminder_time("next week", now=now) is None
+
+
 def test_reminder_manager_uses_stable_data_directory(tmp_path) -> None:
     manager = ReminderManager(data_dir=str(tmp_path))
     manager.add_reminder(
@@ -20,6 +55,7 @@ def test_reminder_manager_uses_stable_data_directory(tmp_path) -> None:
         message="check persistence path",
         remind_time=datetime(2026, 3, 12, 9, 30, 0),
     )
+    asyncio.run(manager.flush_reminders())
     assert Path(manager.reminders_file) == (tmp_path / "reminders.json")
     assert Path(manager.reminders_file).exists()
 
@@ -31,6 +67,7 @@ def test_atomic_save_and_load_round_trip(tmp_path) -> None:
         message="round trip reminder",
         remind_time=datetime(2026, 3, 15, 10, 0, 0),
     )
+    manager.save_reminders()
 
     created_files = sorted(path.name for path in tmp_path.iterdir())
     assert created_files == ["reminders.json"]
@@ -40,7 +77,9 @@ def test_atomic_save_and_load_round_trip(tmp_path) -> None:
     assert len(reloaded.reminders) == 1
     assert reloaded.reminders[0]["user_id"] == 7
     assert reloaded.reminders[0]["message"] == "round trip reminder"
-    assert reloaded.reminders[0]["remind_time"] == datetime(2026, 3, 15, 10, 0, 0)
+    assert reloaded.reminders[0]["remind_time"] == datetime(2026, 3, 15, 10, 0, 0).astimezone(timezone.utc)
+    assert reloaded.reminders[0]["remind_time"].tzinfo == timezone.utc
+    assert reloaded.reminders[0]["created_at"] == manager.reminders[0]["created_at"]
 
 
 def test_legacy_fallback_reads_old_files_once(tmp_path, monkeypatch) -> None:
@@ -73,3 +112,196 @@ def test_legacy_fallback_reads_old_files_once(tmp_path, monkeypatch) -> None:
     assert manager.reminders[0]["message"] == "legacy reminder"
     assert downtime is not None
     assert not (legacy_dir / "bot_shutdown.json").exists()
+
+
+def test_pop_due_reminders_returns_due_items_in_time_order(tmp_path) -> None:
+    manager = ReminderManager(data_dir=str(tmp_path))
+    now = datetime.now()
+    manager.add_reminder(user_id=1, message="later", remind_time=now + timedelta(hours=1))
+    manager.add_reminder(user_id=2, message="second", remind_time=now - timedelta(minutes=1))
+    manager.add_reminder(user_id=3, message="first", remind_time=now - timedelta(minutes=5))
+
+    assert manager.pop_due_reminders(now - timedelta(minutes=10)) == []
+    due = manager.pop_due_reminders(now)
+
+    assert [reminder["message"] for reminder in due] == ["first", "second"]
+    assert [reminder["message"] for reminder in manager.reminders] == ["later"]
+    assert manager.next_due == (now + timedelta(hours=1)).astimezone(timezone.utc)
+
+    manager.requeue_reminder(due[0], timedelta(minutes=-10))
+    assert [reminder["message"] for reminder in manager.pop_due_reminders()] == ["first"]
+
+
+def test_flush_reminders_writes_only_when_dirty(tmp_path) -> None:
+    manager = ReminderManager(data_dir=str(tmp_path))
+    manager.add_reminder(user_id=5, message="due soon", remind_time=datetime.now() - timedelta(seconds=1))
+    reminders_path = Path(manager.reminders_file)
+    assert not reminders_path.exists()
+
+    asyncio.run(manager.flush_reminders())
+    assert len(json.loads(reminders_path.read_text(encoding="utf-8"))) == 1
+
+    reminders_path.unlink()
+    asyncio.run(manager.flush_reminders())
+    assert not reminders_path.exists()
+
+    assert len(manager.pop_due_reminders()) == 1
+    asyncio.run(manager.flush_reminders())
+    assert json.loads(reminders_path.read_text(encoding="utf-8")) == []
+
+
+def test_wait_until_due_wakes_when_an_earlier_reminder_is_added(tmp_path) -> None:
+    manager = ReminderManager(data_dir=str(tmp_path))
+    manager.add_reminder(user_id=1, message="much later", remind_time=datetime.now() + timedelta(hours=1))
+
+    async def scenario() -> float:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        waiter = asyncio.create_task(manager.wait_until_due(60))
+        await asyncio.sleep(0)
+        manager.add_reminder(user_id=2, message="sooner", remind_time=datetime.now() + timedelta(minutes=5))
+        await waiter
+        return loop.time() - started
+
+    assert asyncio.run(scenario()) < 5
+
+
+def test_deliver_user_reminders_reuses_cached_dm_channel(tmp_path) -> None:
+    manager = ReminderManager(data_dir=str(tmp_path))
+    sent = []
+    lookups = []
+
+    async def send(*, embeds) -> None:
+        sent.extend(embeds)
+
+    async def create_dm():
+        return SimpleNamespace(send=send)
+
+    def get_user(user_id: int):
+        lookups.append(user_id)
+        return SimpleNamespace(dm_channel=None, create_dm=create_dm)
+
+    bot = SimpleNamespace(get_user=get_user)
+    reminder = {
+        "user_id": 9,
+        "message": "bring the thermal paste",
+        "remind_time": datetime.now(),
+        "created_at": datetime.now() - timedelta(hours=1),
+    }
+
+    async def scenario() -> list:
+        return [await deliver_user_reminders(bot, manager, 9, [reminder], missed=False) for _ in range(2)]
+
+    assert asyncio.run(scenario()) == [["sent"], ["sent"]]
+    assert len(sent) == 2
+    assert lookups == [9]
+
+
+def test_deliver_reminders_requeues_unexpected_failures(tmp_path) -> None:
+    manager = ReminderManager(data_dir=str(tmp_path))
+
+    def get_user(user_id: int):
+        raise RuntimeError("cache exploded")
+
+    reminder = {
+        "user_id": 3,
+        "message": "reseat the RAM",
+        "remind_time": datetime.now(),
+        "created_at": datetime.now(),
+    }
+    now = datetime.now(timezone.utc)
+    retry_count = asyncio.run(
+        deliver_reminders(
+            SimpleNamespace(get_user=get_user),
+            manager,
+            [reminder],
+            missed=False,
+            retry_delay=timedelta(minutes=5),
+            now=now,
+        )
+    )
+
+    assert retry_count == 1
+    assert manager.next_due == now + timedelta(minutes=5)
+
+
+def test_deliver_reminders_batches_each_users_reminders_into_one_dm(tmp_path) -> None:
+    manager = ReminderManager(data_dir=str(tmp_path))
+    messages = []
+
+    async def send(*, embeds) -> None:
+        messages.append(len(embeds))
+
+    def get_user(user_id: int):
+        return SimpleNamespace(dm_channel=SimpleNamespace(send=send))
+
+    now = datetime.now(timezone.utc)
+    reminders = [
+        {"user_id": user_id, "message": f"reminder {index}", "remind_time": now, "created_at": now}
+        for index, user_id in enumerate([1] * 12 + [2])
+    ]
+    retry_count = asyncio.run(
+        deliver_reminders(
+            SimpleNamespace(get_user=get_user),
+            manager,
+            reminders,
+            missed=False,
+            retry_delay=timedelta(minutes=5),
+            now=now,
+        )
+    )
+
+    assert retry_count == 0
+    assert sorted(messages) == [1, 2, 10]
+
+
+def test_deliver_reminders_splits_batches_by_embed_character_budget(tmp_path) -> None:
+    manager = ReminderManager(data_dir=str(tmp_path))
+    messages = []
+
+    async def send(*, embeds) -> None:
+        total = sum(len(embed) for embed in embeds)
+        if total > 6000:
+            raise discord.HTTPException(SimpleNamespace(status=400, reason="Bad Request"), "Embed size exceeds maximum size of 6000")
+        messages.append(total)
+
+    def get_user(user_id: int):
+        return SimpleNamespace(dm_channel=SimpleNamespace(send=send))
+
+    now = datetime.now(timezone.utc)
+    reminders = [
+        {"user_id": 1, "message": "x" * 650, "remind_time": now, "created_at": now}
+        for _ in range(10)
+    ]
+    retry_count = asyncio.run(
+        deliver_reminders(
+            SimpleNamespace(get_user=get_user),
+            manager,
+            reminders,
+            missed=False,
+            retry_delay=timedelta(minutes=5),
+            now=now,
+        )
+    )
+
+    assert retry_count == 0
+    assert len(messages) == 2
+    assert all(total <= 6000 for total in messages)
+
+
+def test_deliver_user_reminders_drops_rejected_messages_instead_of_retrying(tmp_path) -> None:
+    manager = ReminderManager(data_dir=str(tmp_path))
+
+    async def send(*, embeds) -> None:
+        raise discord.HTTPException(SimpleNamespace(status=400, reason="Bad Request"), "Invalid Form Body")
+
+    def get_user(user_id: int):
+        return SimpleNamespace(dm_channel=SimpleNamespace(send=send))
+
+    now = datetime.now(timezone.utc)
+    reminder = {"user_id": 4, "message": "update the BIOS", "remind_time": now, "created_at": now}
+    statuses = asyncio.run(
+        deliver_user_reminders(SimpleNamespace(get_user=get_user), manager, 4, [reminder], missed=False)
+    )
+
+    assert statuses == ["drop"]